@@ -29,6 +29,16 @@ CREATE TABLE IF NOT EXISTS test_tasks (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Dicionário de tipos de registro (cada linha guarda só o id)
+CREATE TABLE IF NOT EXISTS test_md_type (
+    id SMALLSERIAL PRIMARY KEY,
+    name TEXT UNIQUE NOT NULL
+);
+
+INSERT INTO test_md_type (name)
+VALUES ('test'), ('bulk_test'), ('large_series'), ('test_data')
+ON CONFLICT (name) DO NOTHING;
+
 -- Tabela principal de séries temporais
 CREATE TABLE IF NOT EXISTS test_time_series (
     id SERIAL PRIMARY KEY,
@@ -36,7 +46,8 @@ CREATE TABLE IF NOT EXISTS test_time_series (
     task_id INTEGER NOT NULL REFERENCES test_tasks(task_id) ON DELETE CASCADE,
     timestamp TIMESTAMP NOT NULL,
     value DOUBLE PRECISION NOT NULL,
-    metadata JSONB,
+    type_id SMALLINT REFERENCES test_md_type(id),
+    idx INTEGER,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     
     -- Constraint para evitar duplicatas
@@ -72,10 +83,6 @@ CREATE INDEX IF NOT EXISTS idx_ts_task_timestamp
 CREATE INDEX IF NOT EXISTS idx_ts_composite 
     ON test_time_series(user_id, task_id, timestamp DESC);
 
--- Índice para consultas no JSONB metadata (opcional)
-CREATE INDEX IF NOT EXISTS idx_ts_metadata 
-    ON test_time_series USING GIN (metadata);
-
 -- =====================================================
 -- PARTICIONAMENTO POR DATA (OPCIONAL - PARA PRODUÇÃO)
 -- =====================================================
@@ -88,7 +95,8 @@ CREATE TABLE test_time_series_partitioned (
     task_id INTEGER NOT NULL,
     timestamp TIMESTAMP NOT NULL,
     value DOUBLE PRECISION NOT NULL,
-    metadata JSONB,
+    type_id SMALLINT,
+    idx INTEGER,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 ) PARTITION BY RANGE (timestamp);
 
@@ -117,17 +125,21 @@ RETURNS INTEGER AS $$
 DECLARE
     i INTEGER;
     current_timestamp TIMESTAMP;
+    v_type_id SMALLINT;
 BEGIN
+    SELECT id INTO v_type_id FROM test_md_type WHERE name = 'test_data';
+    
     FOR i IN 1..p_num_records LOOP
         current_timestamp := p_start_timestamp + (i || ' seconds')::INTERVAL;
         
-        INSERT INTO test_time_series (user_id, task_id, timestamp, value, metadata)
+        INSERT INTO test_time_series (user_id, task_id, timestamp, value, type_id, idx)
         VALUES (
             p_user_id,
             p_task_id,
             current_timestamp,
             RANDOM() * 100,
-            jsonb_build_object('index', i, 'type', 'test_data')
+            v_type_id,
+            i
         )
         ON CONFLICT (user_id, task_id, timestamp) DO NOTHING;
     END LOOP;
@@ -315,6 +327,7 @@ DROP FUNCTION IF EXISTS get_timeseries_stats();
 DROP FUNCTION IF EXISTS cleanup_old_timeseries(INTEGER);
 DROP FUNCTION IF EXISTS insert_test_timeseries(INTEGER, INTEGER, INTEGER, TIMESTAMP);
 DROP TABLE IF EXISTS test_time_series CASCADE;
+DROP TABLE IF EXISTS test_md_type CASCADE;
 DROP TABLE IF EXISTS test_tasks CASCADE;
 DROP TABLE IF EXISTS test_users CASCADE;
 */
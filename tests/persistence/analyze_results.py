@@ -6,26 +6,87 @@ Este script analisa os resultados dos testes e gera relatórios detalhados,
 gráficos e recomendações de otimização.
 """
 
+import io
 import json
-import matplotlib.pyplot as plt
-import seaborn as sns
+import os
+import sys
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional, cai para o json da stdlib
+    orjson = None
+
+
+# Modelos de recomendação (constantes; apenas nome/razão variam)
+_REC_SINGLE = "Inserção individual está lenta. Use inserção em massa sempre que possível."
+_REC_BULK = (
+    "Performance de bulk insert abaixo do esperado. Verifique:\n"
+    "   - Configuração shared_buffers do PostgreSQL\n"
+    "   - Desabilitar triggers/constraints temporariamente\n"
+    "   - Aumentar work_mem"
+)
+_REC_LARGE_SERIES = (
+    "Para séries muito grandes, considere:\n"
+    "   - Particionamento da tabela por data\n"
+    "   - Usar COPY ao invés de INSERT\n"
+    "   - Desabilitar índices durante carga massiva"
+)
+_REC_ROLLBACK = "CRÍTICO: Rollback não está funcionando. Verifique configuração de transações."
+_REC_P50 = (
+    "{name}: P50 está {ratio:.1f}x acima do baseline.\n"
+    "   - Verificar se índices estão sendo usados (EXPLAIN ANALYZE)\n"
+    "   - Considerar índice adicional\n"
+    "   - Executar VACUUM ANALYZE"
+)
+_REC_P95 = (
+    "{name}: P95 está {ratio:.1f}x acima do baseline.\n"
+    "   - Verificar queries lentas com pg_stat_statements\n"
+    "   - Implementar cache para queries frequentes"
+)
 
 
 class ResultsAnalyzer:
-    """Analisa resultados dos testes de persistência"""
+    """
+    Analisa resultados dos testes de persistência
+    
+    A saída textual é acumulada em buffer e escrita de uma só vez em
+    flush_output() (chamado ao final de run_full_analysis).
+    """
     
-    def __init__(self, results: Dict):
+    __slots__ = (
+        'results', 'verbose', 'recommendations', 'baselines',
+        '_buf', '_out_dir', '_latency_cache', '_q_keys', '_q_p50', '_q_p95'
+    )
+    
+    _SEP = "=" * 60
+    
+    # Módulos de gráficos, importados apenas na primeira chamada a generate_charts
+    _plt = None
+    _sns = None
+    _Figure = None
+    _FigureCanvasAgg = None
+    _styled: bool = False
+    
+    def __init__(self, results: Dict, verbose: bool = True):
         """
         Inicializa o analisador
         
         Args:
             results: dicionário com resultados dos testes
+            verbose: se False, a saída textual é descartada
         """
         self.results = results
+        self.verbose = verbose
+        self._buf = io.StringIO()
+        self._out_dir = None
         self.recommendations = []
+        self._latency_cache: Dict[str, Tuple[float, float]] = {}
         
         # Baselines para comparação
         self.baselines = {
@@ -41,183 +102,242 @@ class ResultsAnalyzer:
                 'complex_p95_ms': 75
             }
         }
+        
+        # Baselines de consulta em layout SoA: um array contíguo por percentil
+        baselines_q = self.baselines['query']
+        self._q_keys = np.array(['by_user', 'by_task', 'by_period', 'complex'])
+        is_complex = self._q_keys == 'complex'
+        self._q_p50 = np.where(is_complex, baselines_q['complex_p50_ms'],
+                               baselines_q['p50_ms']).astype(np.float64)
+        self._q_p95 = np.where(is_complex, baselines_q['complex_p95_ms'],
+                               baselines_q['p95_ms']).astype(np.float64)
+    
+    def _emit(self, line: str = ""):
+        """Acumula uma linha de saída no buffer"""
+        if self.verbose:
+            self._buf.write(line)
+            self._buf.write("\n")
+    
+    def flush_output(self):
+        """Escreve a saída acumulada no stdout com uma única chamada"""
+        if self.verbose:
+            sys.stdout.write(self._buf.getvalue())
+            sys.stdout.flush()
+        self._buf = io.StringIO()
+    
+    @classmethod
+    def _load_plotting(cls):
+        """Importa matplotlib (backend Agg) e seaborn sob demanda"""
+        if cls._plt is None:
+            import matplotlib
+            matplotlib.use('Agg')  # backend não interativo: apenas gravação em arquivo
+            import matplotlib.pyplot as plt
+            import seaborn as sns
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+            
+            cls._sns = sns
+            cls._Figure = Figure
+            cls._FigureCanvasAgg = FigureCanvasAgg
+            cls._plt = plt
+        return cls._plt, cls._sns, cls._Figure, cls._FigureCanvasAgg
+    
+    def _ensure_out(self, output_dir: str) -> Path:
+        """Cria o diretório de saída apenas na primeira vez em que é usado"""
+        out = Path(output_dir)
+        if out != self._out_dir:
+            out.mkdir(parents=True, exist_ok=True)
+            self._out_dir = out
+        return self._out_dir
+    
+    @staticmethod
+    def _percentiles(samples: Sequence[float]) -> Tuple[float, float]:
+        """
+        Calcula P50 e P95 a partir de latências brutas (ms)
+        
+        Usa np.percentile com a mesma interpolação linear do script de testes,
+        de modo que amostras brutas e p50_ms/p95_ms pré-calculados concordam.
+        
+        Args:
+            samples: latências individuais em milissegundos
+        
+        Returns:
+            Tupla (p50_ms, p95_ms); (nan, nan) se não houver amostras
+        """
+        if len(samples) == 0:
+            return float('nan'), float('nan')
+        
+        p50, p95 = np.percentile(np.asarray(samples, dtype=np.float64), [50, 95])
+        return float(p50), float(p95)
+    
+    def _query_latencies(self, key: str, data: Dict) -> Tuple[float, float]:
+        """Retorna (P50, P95) de uma consulta, preferindo amostras brutas se houver"""
+        if not data.get('samples'):
+            if 'p50_ms' in data:
+                return data['p50_ms'], data['p95_ms']
+            return self._percentiles(())
+        
+        # Percentis de amostras brutas são calculados uma vez por tipo de consulta
+        cached = self._latency_cache.get(key)
+        if cached is None:
+            cached = self._latency_cache[key] = self._percentiles(data['samples'])
+        return cached
     
     def analyze_insertion_performance(self):
         """Analisa performance de inserção"""
-        print("\n" + "="*60)
-        print("ANÁLISE DE PERFORMANCE - INSERÇÃO (Issue #70)")
-        print("="*60)
+        self._emit("\n" + self._SEP)
+        self._emit("ANÁLISE DE PERFORMANCE - INSERÇÃO (Issue #70)")
+        self._emit(self._SEP)
         
         insertion = self.results.get('insertion', {})
+        baselines_ins = self.baselines['insertion']
         
-        # Análise de inserção individual
-        if 'single' in insertion:
-            single = insertion['single']
-            throughput = single['records_per_second']
-            baseline = self.baselines['insertion']['single_records_per_sec']
-            
-            print(f"\n📊 Inserção Individual:")
-            print(f"   Throughput: {throughput:.2f} rec/s")
-            print(f"   Baseline: {baseline} rec/s")
-            
-            if throughput < baseline * 0.8:
-                print(f"   ⚠️  ABAIXO DO ESPERADO ({(throughput/baseline)*100:.1f}%)")
-                self.recommendations.append(
-                    "Inserção individual está lenta. Use inserção em massa sempre que possível."
-                )
-            else:
-                print(f"   ✅ OK ({(throughput/baseline)*100:.1f}%)")
+        # (chave, título, baseline, fração mínima do baseline, status abaixo, status acima, recomendação)
+        insertion_types = [
+            ('single', 'Inserção Individual', 'single_records_per_sec', 0.8,
+             '⚠️  ABAIXO DO ESPERADO', '✅ OK', _REC_SINGLE),
+            ('bulk', 'Inserção em Massa', 'bulk_records_per_sec', 1.0,
+             '⚠️  ABAIXO DO ESPERADO', '✅ EXCELENTE', _REC_BULK),
+            ('large_series', 'Séries Grandes', 'large_series_records_per_sec', 1.0,
+             '⚠️  PODE MELHORAR', '✅ ÓTIMO', _REC_LARGE_SERIES),
+        ]
+        present = [t for t in insertion_types if t[0] in insertion]
         
-        # Análise de inserção em massa
-        if 'bulk' in insertion:
-            bulk = insertion['bulk']
-            throughput = bulk['records_per_second']
-            baseline = self.baselines['insertion']['bulk_records_per_sec']
-            
-            print(f"\n📊 Inserção em Massa:")
-            print(f"   Throughput: {throughput:.2f} rec/s")
-            print(f"   Baseline: {baseline} rec/s")
-            
-            if throughput < baseline:
-                print(f"   ⚠️  ABAIXO DO ESPERADO ({(throughput/baseline)*100:.1f}%)")
-                self.recommendations.append(
-                    "Performance de bulk insert abaixo do esperado. Verifique:\n"
-                    "   - Configuração shared_buffers do PostgreSQL\n"
-                    "   - Desabilitar triggers/constraints temporariamente\n"
-                    "   - Aumentar work_mem"
-                )
-            else:
-                print(f"   ✅ EXCELENTE ({(throughput/baseline)*100:.1f}%)")
+        # Razões throughput/baseline calculadas em uma única passada
+        n = len(present)
+        throughputs = np.fromiter((insertion[t[0]]['records_per_second'] for t in present),
+                                  dtype=np.float64, count=n)
+        baselines = np.fromiter((baselines_ins[t[2]] for t in present), dtype=np.float64, count=n)
+        min_fractions = np.fromiter((t[3] for t in present), dtype=np.float64, count=n)
+        percents = throughputs / baselines * 100
+        below = throughputs < baselines * min_fractions
         
-        # Análise de séries grandes
-        if 'large_series' in insertion:
-            large = insertion['large_series']
-            throughput = large['records_per_second']
-            baseline = self.baselines['insertion']['large_series_records_per_sec']
+        for i, (key, title, baseline_key, _, status_below, status_ok, recommendation) in enumerate(present):
+            self._emit(f"\n📊 {title}:")
+            self._emit(f"   Throughput: {throughputs[i]:.2f} rec/s")
+            if key == 'large_series':
+                self._emit(f"   Tamanho da tabela: {insertion[key].get('table_size', 'N/A')}")
+            self._emit(f"   Baseline: {baselines_ins[baseline_key]} rec/s")
             
-            print(f"\n📊 Séries Grandes:")
-            print(f"   Throughput: {throughput:.2f} rec/s")
-            print(f"   Tamanho da tabela: {large.get('table_size', 'N/A')}")
-            print(f"   Baseline: {baseline} rec/s")
-            
-            if throughput < baseline:
-                print(f"   ⚠️  PODE MELHORAR ({(throughput/baseline)*100:.1f}%)")
-                self.recommendations.append(
-                    "Para séries muito grandes, considere:\n"
-                    "   - Particionamento da tabela por data\n"
-                    "   - Usar COPY ao invés de INSERT\n"
-                    "   - Desabilitar índices durante carga massiva"
-                )
+            if below[i]:
+                self._emit(f"   {status_below} ({percents[i]:.1f}%)")
+                self.recommendations.append(recommendation)
             else:
-                print(f"   ✅ ÓTIMO ({(throughput/baseline)*100:.1f}%)")
+                self._emit(f"   {status_ok} ({percents[i]:.1f}%)")
         
         # Análise de rollback
         if 'rollback' in insertion:
             rollback = insertion['rollback']
-            print(f"\n📊 Integridade Transacional:")
+            self._emit(f"\n📊 Integridade Transacional:")
             if rollback['rollback_successful']:
-                print(f"   ✅ Rollback funcionando corretamente")
-                print(f"   ✅ Constraints de FK validadas")
+                self._emit(f"   ✅ Rollback funcionando corretamente")
+                self._emit(f"   ✅ Constraints de FK validadas")
             else:
-                print(f"   ❌ PROBLEMA: Rollback falhou!")
-                self.recommendations.append(
-                    "CRÍTICO: Rollback não está funcionando. Verifique configuração de transações."
-                )
+                self._emit(f"   ❌ PROBLEMA: Rollback falhou!")
+                self.recommendations.append(_REC_ROLLBACK)
     
     def analyze_query_performance(self):
         """Analisa performance de consultas"""
-        print("\n" + "="*60)
-        print("ANÁLISE DE PERFORMANCE - CONSULTAS (Issue #71)")
-        print("="*60)
+        self._emit("\n" + self._SEP)
+        self._emit("ANÁLISE DE PERFORMANCE - CONSULTAS (Issue #71)")
+        self._emit(self._SEP)
         
         query = self.results.get('query', {})
         
-        baseline_p50 = self.baselines['query']['p50_ms']
-        baseline_p95 = self.baselines['query']['p95_ms']
+        query_names = {
+            'by_user': 'Consulta por Usuário',
+            'by_task': 'Consulta por Tarefa',
+            'by_period': 'Consulta por Período',
+            'complex': 'Consulta Complexa'
+        }
         
-        query_types = [
-            ('by_user', 'Consulta por Usuário'),
-            ('by_task', 'Consulta por Tarefa'),
-            ('by_period', 'Consulta por Período'),
-            ('complex', 'Consulta Complexa')
-        ]
+        present = np.fromiter((key in query for key in self._q_keys.tolist()),
+                              dtype=bool, count=self._q_keys.size)
+        keys = self._q_keys[present].tolist()
         
-        for key, name in query_types:
-            if key in query:
-                data = query[key]
-                p50 = data['p50_ms']
-                p95 = data['p95_ms']
-                
-                # Ajustar baseline para query complexa
-                if key == 'complex':
-                    baseline_p50 = self.baselines['query']['complex_p50_ms']
-                    baseline_p95 = self.baselines['query']['complex_p95_ms']
-                else:
-                    baseline_p50 = self.baselines['query']['p50_ms']
-                    baseline_p95 = self.baselines['query']['p95_ms']
-                
-                print(f"\n📊 {name}:")
-                print(f"   P50: {p50:.2f}ms (baseline: {baseline_p50}ms)")
-                print(f"   P95: {p95:.2f}ms (baseline: {baseline_p95}ms)")
-                
-                # Avaliar P50
-                if p50 > baseline_p50:
-                    ratio = p50 / baseline_p50
-                    if ratio > 2:
-                        print(f"   ⚠️  P50 MUITO ACIMA do esperado ({ratio:.1f}x)")
-                        self.recommendations.append(
-                            f"{name}: P50 está {ratio:.1f}x acima do baseline.\n"
-                            f"   - Verificar se índices estão sendo usados (EXPLAIN ANALYZE)\n"
-                            f"   - Considerar índice adicional\n"
-                            f"   - Executar VACUUM ANALYZE"
-                        )
-                    else:
-                        print(f"   ⚠️  P50 ligeiramente acima ({ratio:.1f}x)")
+        # Matrizes (n, 2) com P50/P95 observados e baselines; razões em uma passada
+        baselines = np.column_stack((self._q_p50[present], self._q_p95[present]))
+        observed = np.array([self._query_latencies(key, query[key]) for key in keys],
+                            dtype=np.float64).reshape(-1, 2)
+        ratios = observed / baselines
+        above = ratios > 1
+        severe = ratios > 2
+        
+        for i, key in enumerate(keys):
+            name = query_names[key]
+            p50, p95 = observed[i]
+            baseline_p50, baseline_p95 = baselines[i]
+            
+            self._emit(f"\n📊 {name}:")
+            if np.isnan(p50):
+                self._emit(f"   ⚠️  Sem amostras de latência")
+                continue
+            self._emit(f"   P50: {p50:.2f}ms (baseline: {baseline_p50:g}ms)")
+            self._emit(f"   P95: {p95:.2f}ms (baseline: {baseline_p95:g}ms)")
+            
+            # Avaliar P50
+            if above[i, 0]:
+                ratio = ratios[i, 0]
+                if severe[i, 0]:
+                    self._emit(f"   ⚠️  P50 MUITO ACIMA do esperado ({ratio:.1f}x)")
+                    self.recommendations.append(_REC_P50.format(name=name, ratio=ratio))
                 else:
-                    print(f"   ✅ P50 OK")
-                
-                # Avaliar P95
-                if p95 > baseline_p95:
-                    ratio = p95 / baseline_p95
-                    if ratio > 2:
-                        print(f"   ⚠️  P95 MUITO ACIMA do esperado ({ratio:.1f}x)")
-                        self.recommendations.append(
-                            f"{name}: P95 está {ratio:.1f}x acima do baseline.\n"
-                            f"   - Verificar queries lentas com pg_stat_statements\n"
-                            f"   - Implementar cache para queries frequentes"
-                        )
-                    else:
-                        print(f"   ⚠️  P95 ligeiramente acima ({ratio:.1f}x)")
+                    self._emit(f"   ⚠️  P50 ligeiramente acima ({ratio:.1f}x)")
+            else:
+                self._emit(f"   ✅ P50 OK")
+            
+            # Avaliar P95
+            if above[i, 1]:
+                ratio = ratios[i, 1]
+                if severe[i, 1]:
+                    self._emit(f"   ⚠️  P95 MUITO ACIMA do esperado ({ratio:.1f}x)")
+                    self.recommendations.append(_REC_P95.format(name=name, ratio=ratio))
                 else:
-                    print(f"   ✅ P95 OK")
+                    self._emit(f"   ⚠️  P95 ligeiramente acima ({ratio:.1f}x)")
+            else:
+                self._emit(f"   ✅ P95 OK")
     
     def generate_recommendations(self):
         """Gera recomendações baseadas nos resultados"""
-        print("\n" + "="*60)
-        print("RECOMENDAÇÕES DE OTIMIZAÇÃO")
-        print("="*60)
+        self._emit("\n" + self._SEP)
+        self._emit("RECOMENDAÇÕES DE OTIMIZAÇÃO")
+        self._emit(self._SEP)
         
         if not self.recommendations:
-            print("\n✅ Nenhuma otimização crítica necessária!")
-            print("   Sistema está performando dentro dos baselines esperados.")
+            self._emit("\n✅ Nenhuma otimização crítica necessária!")
+            self._emit("   Sistema está performando dentro dos baselines esperados.")
         else:
-            print(f"\n⚠️  {len(self.recommendations)} área(s) identificada(s) para melhoria:\n")
+            self._emit(f"\n⚠️  {len(self.recommendations)} área(s) identificada(s) para melhoria:\n")
             for i, rec in enumerate(self.recommendations, 1):
-                print(f"{i}. {rec}\n")
+                self._emit(f"{i}. {rec}\n")
     
-    def generate_charts(self, output_dir: str = "results"):
-        """Gera gráficos de visualização"""
-        print(f"\n📊 Gerando gráficos em {output_dir}/...")
+    def generate_charts(self, output_dir: str = "results", dpi: int = 150):
+        """
+        Gera gráficos de visualização
+        
+        Args:
+            output_dir: diretório de saída dos PNGs
+            dpi: resolução das imagens (300 para material de publicação)
+        """
+        if 'insertion' not in self.results and 'query' not in self.results:
+            return
         
-        Path(output_dir).mkdir(exist_ok=True)
+        self._emit(f"\n📊 Gerando gráficos em {output_dir}/...")
         
-        # Configurar estilo
-        sns.set_style("whitegrid")
-        plt.rcParams['figure.figsize'] = (12, 8)
+        out = self._ensure_out(output_dir)
+        plt, sns, Figure, FigureCanvasAgg = self._load_plotting()
+        
+        # Configurar estilo (estado global, aplicado uma única vez)
+        if not ResultsAnalyzer._styled:
+            sns.set_style("whitegrid")
+            plt.rcParams.update({'figure.figsize': (12, 8), 'figure.dpi': 100})
+            ResultsAnalyzer._styled = True
         
         # Gráfico 1: Throughput de Inserção
         if 'insertion' in self.results:
-            fig, ax = plt.subplots()
+            fig = Figure(constrained_layout=True)
+            FigureCanvasAgg(fig)
+            ax = fig.subplots()
             
             insertion = self.results['insertion']
             methods = []
@@ -241,20 +361,17 @@ class ResultsAnalyzer:
             ax.set_yscale('log')
             
             # Adicionar valores nas barras
-            for bar in bars:
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{int(height):,}',
-                       ha='center', va='bottom')
+            ax.bar_label(bars, labels=[f'{int(t):,}' for t in throughputs], padding=3)
             
-            plt.tight_layout()
-            plt.savefig(f"{output_dir}/insertion_throughput.png", dpi=300)
-            print(f"   ✓ {output_dir}/insertion_throughput.png")
-            plt.close()
+            chart_file = out / "insertion_throughput.png"
+            fig.savefig(chart_file, bbox_inches='tight', dpi=dpi)
+            self._emit(f"   ✓ {chart_file}")
         
         # Gráfico 2: Latências de Consulta (P50 vs P95)
         if 'query' in self.results:
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+            fig = Figure(figsize=(14, 6), constrained_layout=True)
+            FigureCanvasAgg(fig)
+            ax1, ax2 = fig.subplots(1, 2)
             
             query = self.results['query']
             query_names = []
@@ -269,9 +386,12 @@ class ResultsAnalyzer:
                         'by_period': 'Por Período',
                         'complex': 'Complexa'
                     }
+                    p50, p95 = self._query_latencies(key, query[key])
+                    if np.isnan(p50):
+                        continue
                     query_names.append(labels[key])
-                    p50_values.append(query[key]['p50_ms'])
-                    p95_values.append(query[key]['p95_ms'])
+                    p50_values.append(p50)
+                    p95_values.append(p95)
             
             # P50
             bars1 = ax1.bar(query_names, p50_values, color='#3498db')
@@ -281,11 +401,7 @@ class ResultsAnalyzer:
                        color='r', linestyle='--', label='Baseline')
             ax1.legend()
             
-            for bar in bars1:
-                height = bar.get_height()
-                ax1.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{height:.1f}',
-                        ha='center', va='bottom')
+            ax1.bar_label(bars1, fmt='%.1f', padding=3)
             
             # P95
             bars2 = ax2.bar(query_names, p95_values, color='#e74c3c')
@@ -295,75 +411,125 @@ class ResultsAnalyzer:
                        color='r', linestyle='--', label='Baseline')
             ax2.legend()
             
-            for bar in bars2:
-                height = bar.get_height()
-                ax2.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{height:.1f}',
-                        ha='center', va='bottom')
+            ax2.bar_label(bars2, fmt='%.1f', padding=3)
             
-            plt.tight_layout()
-            plt.savefig(f"{output_dir}/query_latencies.png", dpi=300)
-            print(f"   ✓ {output_dir}/query_latencies.png")
-            plt.close()
+            chart_file = out / "query_latencies.png"
+            fig.savefig(chart_file, bbox_inches='tight', dpi=dpi)
+            self._emit(f"   ✓ {chart_file}")
         
-        print("   ✅ Gráficos gerados com sucesso!")
+        self._emit("   ✅ Gráficos gerados com sucesso!")
     
     def save_report(self, output_dir: str = "results"):
         """Salva relatório completo em arquivo"""
-        Path(output_dir).mkdir(exist_ok=True)
+        out = self._ensure_out(output_dir)
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         
         # Salvar JSON com resultados
-        json_file = f"{output_dir}/results_{timestamp}.json"
-        with open(json_file, 'w') as f:
-            json.dump(self.results, f, indent=2)
-        print(f"\n💾 Resultados salvos: {json_file}")
+        json_file = out / f"results_{timestamp}.json"
+        if orjson is not None:
+            json_file.write_bytes(orjson.dumps(
+                self.results,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
+        else:
+            with open(json_file, 'w') as f:
+                json.dump(self.results, f, indent=2)
+        self._emit(f"\n💾 Resultados salvos: {json_file}")
         
         # Salvar relatório em texto
-        txt_file = f"{output_dir}/report_{timestamp}.txt"
+        txt_file = out / f"report_{timestamp}.txt"
+        parts = [
+            self._SEP + "\n",
+            "RELATÓRIO DE TESTES DE PERSISTÊNCIA\n",
+            "Issues #70 e #71 - dqtimes\n",
+            f"Data: {now.strftime('%Y-%m-%d %H:%M:%S')}\n",
+            self._SEP + "\n\n",
+        ]
+        
+        # Inserção
+        parts.append("### ISSUE #70 - TESTES DE INSERÇÃO ###\n\n")
+        if 'insertion' in self.results:
+            for method, data in self.results['insertion'].items():
+                parts.append(f"{method.upper()}:\n")
+                parts.extend(f"  {key}: {value}\n" for key, value in data.items())
+                parts.append("\n")
+        
+        # Consultas
+        parts.append("\n### ISSUE #71 - TESTES DE CONSULTA ###\n\n")
+        if 'query' in self.results:
+            for query_type, data in self.results['query'].items():
+                parts.append(f"{query_type.upper()}:\n")
+                parts.extend(f"  {key}: {value}\n" for key, value in data.items())
+                parts.append("\n")
+        
+        # Recomendações
+        parts.append("\n### RECOMENDAÇÕES ###\n\n")
+        if self.recommendations:
+            for i, rec in enumerate(self.recommendations, 1):
+                parts.append(f"{i}. {rec}\n\n")
+        else:
+            parts.append("✅ Nenhuma otimização crítica necessária.\n")
+        
         with open(txt_file, 'w', encoding='utf-8') as f:
-            f.write("="*60 + "\n")
-            f.write("RELATÓRIO DE TESTES DE PERSISTÊNCIA\n")
-            f.write("Issues #70 e #71 - dqtimes\n")
-            f.write(f"Data: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("="*60 + "\n\n")
-            
-            # Inserção
-            f.write("### ISSUE #70 - TESTES DE INSERÇÃO ###\n\n")
-            if 'insertion' in self.results:
-                for method, data in self.results['insertion'].items():
-                    f.write(f"{method.upper()}:\n")
-                    for key, value in data.items():
-                        f.write(f"  {key}: {value}\n")
-                    f.write("\n")
-            
-            # Consultas
-            f.write("\n### ISSUE #71 - TESTES DE CONSULTA ###\n\n")
-            if 'query' in self.results:
-                for query_type, data in self.results['query'].items():
-                    f.write(f"{query_type.upper()}:\n")
-                    for key, value in data.items():
-                        f.write(f"  {key}: {value}\n")
-                    f.write("\n")
-            
-            # Recomendações
-            f.write("\n### RECOMENDAÇÕES ###\n\n")
-            if self.recommendations:
-                for i, rec in enumerate(self.recommendations, 1):
-                    f.write(f"{i}. {rec}\n\n")
-            else:
-                f.write("✅ Nenhuma otimização crítica necessária.\n")
+            f.write(''.join(parts))
         
-        print(f"💾 Relatório salvo: {txt_file}")
+        self._emit(f"💾 Relatório salvo: {txt_file}")
     
-    def run_full_analysis(self):
-        """Executa análise completa"""
-        self.analyze_insertion_performance()
-        self.analyze_query_performance()
-        self.generate_recommendations()
-        self.generate_charts()
-        self.save_report()
+    def run_full_analysis(self, output_dir: str = "results"):
+        """
+        Executa análise completa
+        
+        Args:
+            output_dir: diretório de saída de gráficos e relatórios
+        """
+        if not self.results.get('insertion') and not self.results.get('query'):
+            self._emit("⚠️  Nenhum resultado de inserção ou consulta para analisar.")
+            self.flush_output()
+            return
+        
+        try:
+            self.analyze_insertion_performance()
+            self.analyze_query_performance()
+            self.generate_recommendations()
+            self.generate_charts(output_dir)
+            self.save_report(output_dir)
+        finally:
+            self.flush_output()
+
+
+@lru_cache(maxsize=32)
+def _load_results_cached(filepath: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Faz o parse do JSON de resultados; mtime e tamanho entram na chave do
+    cache para que alterações no arquivo invalidem a entrada
+    """
+    if orjson is not None:
+        data = Path(filepath).read_bytes()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejeita NaN/Infinity, que o json da stdlib grava por padrão
+            return json.loads(data)
+    with open(filepath, 'r') as f:
+        return json.load(f)
+
+
+def load_results(filepath: str) -> Dict:
+    """
+    Carrega resultados de um arquivo JSON, reaproveitando parses anteriores
+    enquanto o arquivo não for modificado
+    
+    Args:
+        filepath: caminho para arquivo JSON com resultados
+    
+    Returns:
+        Dicionário com resultados dos testes (compartilhado entre chamadas,
+        não deve ser modificado)
+    """
+    st = os.stat(filepath)
+    return _load_results_cached(os.path.abspath(filepath), st.st_mtime_ns, st.st_size)
 
 
 def analyze_from_file(filepath: str):
@@ -373,17 +539,55 @@ def analyze_from_file(filepath: str):
     Args:
         filepath: caminho para arquivo JSON com resultados
     """
-    with open(filepath, 'r') as f:
-        results = json.load(f)
+    results = load_results(filepath)
     
     analyzer = ResultsAnalyzer(results)
     analyzer.run_full_analysis()
 
 
-if __name__ == "__main__":
-    import sys
+def analyze_from_files(filepaths: List[str], output_dir: str = "results"):
+    """
+    Analisa vários arquivos de resultados
+    
+    Os JSONs são lidos em paralelo (etapa limitada por IO) e as análises
+    executadas em sequência. Cada arquivo gera sua saída em
+    output_dir/<nome do arquivo>; nomes repetidos (ex.: a.json e sub/a.json)
+    recebem o sufixo _<n>, com n a partir da posição na lista e incrementado
+    até não coincidir com nenhum outro diretório, para que um não sobrescreva
+    o relatório e os gráficos do outro.
+    
+    Args:
+        filepaths: caminhos para arquivos JSON com resultados
+        output_dir: diretório base de saída
+    """
+    if not filepaths:
+        return
     
-    if len(sys.argv) > 1:
+    with ThreadPoolExecutor(max_workers=min(8, len(filepaths))) as executor:
+        results_list = list(executor.map(load_results, filepaths))
+    
+    stems = [Path(filepath).stem for filepath in filepaths]
+    repeated = {stem for stem in stems if stems.count(stem) > 1}
+    # Nomes de arquivo reais têm prioridade sobre os sufixos gerados
+    taken = set(stems)
+    
+    for i, (stem, results) in enumerate(zip(stems, results_list)):
+        subdir = stem
+        if stem in repeated:
+            n = i
+            while f"{stem}_{n}" in taken:
+                n += 1
+            subdir = f"{stem}_{n}"
+            taken.add(subdir)
+        analyzer = ResultsAnalyzer(results)
+        analyzer.run_full_analysis(str(Path(output_dir) / subdir))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2:
+        # Análise em lote de vários arquivos
+        analyze_from_files(sys.argv[1:])
+    elif len(sys.argv) > 1:
         # Análise de arquivo existente
         analyze_from_file(sys.argv[1])
     else:
@@ -6,29 +6,119 @@ Parte 1: Testes de Inserção (#70)
 Parte 2: Testes de Consulta (#71)
 """
 
+import csv
+import io
 import time
 import psycopg2
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
 import numpy as np
-import pandas as pd
 from datetime import datetime, timedelta
-from typing import List, Tuple, Dict
-import json
-import statistics
+from typing import List, Sequence, Tuple, Dict
 
 
 class TimeSeriesPersistenceTest:
     """Classe para testar persistência de séries temporais no PostgreSQL"""
     
-    def __init__(self, db_config: dict):
+    INSERT_SQL = """
+        INSERT INTO test_time_series (user_id, task_id, timestamp, value, type_id, idx)
+        VALUES (%s, %s, %s, %s, %s, %s)
+    """
+    
+    VALUES_SQL = """
+        INSERT INTO test_time_series (user_id, task_id, timestamp, value, type_id, idx)
+        VALUES %s
+    """
+    
+    PREPARE_SQL = """
+        PREPARE ts_ins (integer, integer, timestamp, double precision, smallint, integer) AS
+        INSERT INTO test_time_series (user_id, task_id, timestamp, value, type_id, idx)
+        VALUES ($1, $2, $3, $4, $5, $6)
+    """
+    
+    COPY_SQL = """
+        COPY test_time_series (user_id, task_id, timestamp, value, type_id, idx)
+        FROM STDIN WITH (FORMAT CSV)
+    """
+    
+    DRIVERS = ('psycopg2', 'psycopg')
+    
+    QUERY_TITLES = {
+        'by_user': 'Consulta por Usuário',
+        'by_task': 'Consulta por Tarefa',
+        'by_period': 'Consulta por Período',
+        'complex': 'Consulta Complexa'
+    }
+    
+    QUERY_SQL = {
+        'by_user': """
+            SELECT timestamp, value FROM test_time_series
+            WHERE user_id = %s
+            ORDER BY timestamp DESC
+            LIMIT 1000
+        """,
+        'by_task': """
+            SELECT timestamp, value FROM test_time_series
+            WHERE task_id = %s
+            ORDER BY timestamp DESC
+            LIMIT 1000
+        """,
+        'by_period': """
+            SELECT timestamp, value FROM test_time_series
+            WHERE timestamp BETWEEN %s AND %s
+            ORDER BY timestamp DESC
+        """,
+        'complex': """
+            SELECT timestamp, value FROM test_time_series
+            WHERE user_id = %s 
+              AND task_id = %s
+              AND timestamp BETWEEN %s AND %s
+            ORDER BY timestamp DESC
+        """
+    }
+    
+    # Janela da consulta by_period
+    PERIOD_DAYS = 1
+    
+    # Consultas sem LIMIT: lidas em streaming por cursor server-side
+    STREAMED_QUERIES = frozenset({'by_period'})
+    
+    # Nós de leitura que indicam uso de índice nos planos (analyze_query_plans)
+    INDEX_NODE_TYPES = frozenset({'Index Scan', 'Index Only Scan', 'Bitmap Index Scan'})
+    
+    # Conexões máximas do pool (limite de workers em _parallel_insert)
+    POOL_MAX_CONN = 16
+    
+    # TCP keepalive: conexões ociosas do pool não caem silenciosamente
+    KEEPALIVES = {'keepalives': 1, 'keepalives_idle': 30, 'tcp_user_timeout': 30000}
+    
+    # Tipos de registro gerados pelos testes (dicionário em test_md_type)
+    MD_TYPES = ('test', 'bulk_test', 'large_series')
+    
+    def __init__(self, db_config: dict, driver: str = 'psycopg2'):
         """
         Inicializa conexão com banco de dados
         
         Args:
             db_config: dicionário com configurações (host, database, user, password, port)
+            driver: 'psycopg2' ou 'psycopg' (psycopg 3, protocolo binário + pipeline)
         """
+        if driver not in self.DRIVERS:
+            raise ValueError(f"Driver desconhecido: {driver}")
+        
         self.db_config = db_config
+        self.driver = driver
         self.conn = None
         self.cursor = None
+        self.pool = None
+        self.hypertable = False
+        self._md_type_ids = {}
+        # IDs e timestamp de referência das consultas (ver insert_test_data)
+        self._probe_user_id = None
+        self._probe_task_id = None
+        self._max_ts = None
         self.results = {
             'insertion': {},
             'query': {},
@@ -38,9 +128,21 @@ class TimeSeriesPersistenceTest:
     def connect(self):
         """Estabelece conexão com o banco de dados"""
         try:
-            self.conn = psycopg2.connect(**self.db_config)
-            self.cursor = self.conn.cursor()
-            print("✓ Conexão estabelecida com sucesso")
+            if self.driver == 'psycopg':
+                import psycopg
+                
+                params = {**self.KEEPALIVES, **self.db_config}
+                if 'database' in params:
+                    params['dbname'] = params.pop('database')
+                self.conn = psycopg.connect(**params)
+                self.cursor = self.conn.cursor(binary=True)
+            else:
+                params = {**self.KEEPALIVES, **self.db_config}
+                self.conn = psycopg2.connect(**params)
+                self.cursor = self.conn.cursor()
+                # Conexões extras para inserções paralelas (ver _conn)
+                self.pool = ThreadedConnectionPool(1, self.POOL_MAX_CONN, **params)
+            print(f"✓ Conexão estabelecida com sucesso ({self.driver})")
         except Exception as e:
             print(f"✗ Erro ao conectar: {e}")
             raise
@@ -51,6 +153,8 @@ class TimeSeriesPersistenceTest:
             self.cursor.close()
         if self.conn:
             self.conn.close()
+        if self.pool:
+            self.pool.closeall()
         print("✓ Conexão fechada")
     
     def create_test_tables(self):
@@ -75,6 +179,22 @@ class TimeSeriesPersistenceTest:
             )
         """)
         
+        # Dicionário de tipos de registro: cada linha guarda só o id (2 bytes)
+        # em vez de repetir o mesmo JSON em todas as linhas
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS test_md_type (
+                id SMALLSERIAL PRIMARY KEY,
+                name TEXT UNIQUE NOT NULL
+            )
+        """)
+        self.cursor.execute("""
+            INSERT INTO test_md_type (name)
+            SELECT unnest(%s::text[])
+            ON CONFLICT (name) DO NOTHING
+        """, (list(self.MD_TYPES),))
+        self.cursor.execute("SELECT name, id FROM test_md_type")
+        self._md_type_ids = dict(self.cursor.fetchall())
+        
         # Tabela principal de séries temporais
         self.cursor.execute("""
             CREATE TABLE IF NOT EXISTS test_time_series (
@@ -83,58 +203,381 @@ class TimeSeriesPersistenceTest:
                 task_id INTEGER REFERENCES test_tasks(task_id),
                 timestamp TIMESTAMP NOT NULL,
                 value DOUBLE PRECISION NOT NULL,
-                metadata JSONB,
+                type_id SMALLINT REFERENCES test_md_type(id),
+                idx INTEGER,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
         
+        # IF NOT EXISTS mantém uma tabela antiga (coluna metadata JSONB)
+        self.cursor.execute("""
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = 'test_time_series' AND column_name = 'type_id'
+        """)
+        if self.cursor.fetchone() is None:
+            self.conn.rollback()
+            raise RuntimeError(
+                "test_time_series usa o esquema antigo (metadata JSONB); "
+                "remova-a com cleanup_test_data() ou recrie via setup_database.sql"
+            )
+        
         self.conn.commit()
         print("✓ Tabelas de teste criadas")
     
-    def create_indexes(self):
-        """Cria índices para otimizar consultas"""
+    def create_hypertable(self, chunk_interval: str = '1 hour') -> bool:
+        """
+        Converte test_time_series em hypertable do TimescaleDB
+        
+        Consultas por período passam a ignorar chunks fora do intervalo.
+        Se a extensão não estiver instalada, a tabela comum é mantida.
+        
+        Args:
+            chunk_interval: intervalo de tempo coberto por cada chunk
+        
+        Returns:
+            True se a tabela é uma hypertable
+        """
+        try:
+            self.cursor.execute("CREATE EXTENSION IF NOT EXISTS timescaledb")
+            self.cursor.execute("""
+                SELECT 1 FROM timescaledb_information.hypertables
+                WHERE hypertable_name = 'test_time_series'
+            """)
+            if self.cursor.fetchone() is None:
+                # Índices únicos de uma hypertable devem incluir a coluna de tempo
+                self.cursor.execute(
+                    "ALTER TABLE test_time_series DROP CONSTRAINT IF EXISTS test_time_series_pkey"
+                )
+                self.cursor.execute("ALTER TABLE test_time_series ADD PRIMARY KEY (id, timestamp)")
+                self.cursor.execute("""
+                    SELECT create_hypertable('test_time_series', 'timestamp',
+                                             chunk_time_interval => %s::interval,
+                                             migrate_data => TRUE)
+                """, (chunk_interval,))
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            print(f"⚠ TimescaleDB indisponível, usando tabela comum: {type(e).__name__}")
+            return False
+        
+        self.hypertable = True
+        print(f"✓ Hypertable criada (chunks de {chunk_interval})")
+        return True
+    
+    def compress_chunks(self) -> Dict:
+        """
+        Habilita a compressão nativa do TimescaleDB e comprime os chunks
+        
+        Returns:
+            Dicionário com duração e tamanho da tabela após compressão
+        """
+        if not self.hypertable:
+            return {}
+        
+        print("\n--- Compressão de Chunks (TimescaleDB) ---")
+        
+        start_time = time.time()
+        
+        # Em reexecuções a compressão já está habilitada e o TimescaleDB recusa
+        # alterar a configuração com chunks já comprimidos
+        self.cursor.execute("""
+            SELECT compression_enabled FROM timescaledb_information.hypertables
+            WHERE hypertable_name = 'test_time_series'
+        """)
+        row = self.cursor.fetchone()
+        if not (row and row[0]):
+            self.cursor.execute("""
+                ALTER TABLE test_time_series SET (
+                    timescaledb.compress,
+                    timescaledb.compress_segmentby = 'user_id, task_id',
+                    timescaledb.compress_orderby = 'timestamp DESC'
+                )
+            """)
+        self.cursor.execute("""
+            SELECT compress_chunk(c, if_not_compressed => TRUE)
+            FROM show_chunks('test_time_series') c
+        """)
+        self.conn.commit()
+        duration = time.time() - start_time
+        
+        self.cursor.execute("SELECT pg_size_pretty(hypertable_size('test_time_series'))")
+        table_size = self.cursor.fetchone()[0]
+        
+        result = {
+            'duration_seconds': duration,
+            'table_size': table_size
+        }
+        
+        print(f"  Duração: {duration:.2f}s")
+        print(f"  Tamanho da tabela comprimida: {table_size}")
+        
+        self.results['insertion']['compression'] = result
+        return result
+    
+    def create_indexes(self) -> float:
+        """
+        Cria índices para otimizar consultas
+        
+        Returns:
+            Tempo de criação dos índices em segundos
+        """
         
         indexes = [
             "CREATE INDEX IF NOT EXISTS idx_ts_user_id ON test_time_series(user_id)",
             "CREATE INDEX IF NOT EXISTS idx_ts_task_id ON test_time_series(task_id)",
+            # btree, não BRIN: as cargas começam todas em datetime.now() (faixas de
+            # tempo sobrepostas) e os workers paralelos intercalam as páginas do
+            # heap, então os resumos min/max do BRIN cobririam quase todo o período
             "CREATE INDEX IF NOT EXISTS idx_ts_timestamp ON test_time_series(timestamp)",
             "CREATE INDEX IF NOT EXISTS idx_ts_user_timestamp ON test_time_series(user_id, timestamp)",
             "CREATE INDEX IF NOT EXISTS idx_ts_task_timestamp ON test_time_series(task_id, timestamp)",
-            "CREATE INDEX IF NOT EXISTS idx_ts_composite ON test_time_series(user_id, task_id, timestamp)"
+            # INCLUDE (value): a consulta complexa é resolvida por index-only scan
+            "CREATE INDEX IF NOT EXISTS idx_ts_composite "
+            "ON test_time_series(user_id, task_id, timestamp DESC) INCLUDE (value)"
         ]
         
+        if self.hypertable:
+            # A exclusão de chunks cobre o papel do índice composto por período
+            indexes = [idx for idx in indexes if 'idx_ts_composite' not in idx]
+            indexes.append(
+                "CREATE INDEX IF NOT EXISTS idx_ts_user_timestamp_desc "
+                "ON test_time_series(user_id, timestamp DESC)"
+            )
+        
+        start_time = time.time()
+        
         for idx in indexes:
             self.cursor.execute(idx)
         
         self.conn.commit()
-        print("✓ Índices criados")
+        duration = time.time() - start_time
+        
+        # Em hypertables os índices ficam nos chunks; o índice pai tem tamanho 0
+        size_fn = 'hypertable_index_size' if self.hypertable else 'pg_relation_size'
+        self.cursor.execute(f"""
+            SELECT indexname, {size_fn}(indexname::regclass) FROM pg_indexes
+            WHERE tablename = 'test_time_series' AND indexname LIKE 'idx_ts_%'
+        """)
+        self.results['indexes']['sizes'] = dict(self.cursor.fetchall())
+        
+        self.results['indexes']['build_duration_seconds'] = duration
+        print(f"✓ Índices criados ({duration:.2f}s)")
+        return duration
+    
+    def drop_indexes(self):
+        """
+        Remove os índices de test_time_series
+        
+        A carga em massa é mais rápida sobre a tabela sem índices: cada índice
+        é depois construído de uma vez, em vez de atualizado linha a linha.
+        """
+        self.cursor.execute("""
+            SELECT indexname FROM pg_indexes
+            WHERE tablename = 'test_time_series' AND indexname LIKE 'idx_ts_%'
+        """)
+        for (name,) in self.cursor.fetchall():
+            self.cursor.execute(f"DROP INDEX IF EXISTS {name}")
+        
+        self.conn.commit()
+        print("✓ Índices removidos")
+    
+    def _build_records(self, n: int, user_id: int, task_id: int, tag: str) -> List[Tuple]:
+        """
+        Gera n registros de teste de forma vetorizada
+        
+        Args:
+            n: número de registros
+            user_id: usuário dos registros
+            task_id: tarefa dos registros
+            tag: tipo do registro (um de MD_TYPES)
+        
+        Returns:
+            Lista de tuplas (user_id, task_id, timestamp, value, type_id, idx)
+        """
+        values = (np.random.random(n) * 100).tolist()
+        # datetime64[us] -> datetime nativo em um único laço em C
+        timestamps = (np.datetime64(datetime.now(), 'us')
+                      + np.arange(n, dtype='timedelta64[s]')).tolist()
+        type_id = self._md_type_ids[tag]
+        return list(zip([user_id] * n, [task_id] * n, timestamps, values,
+                        [type_id] * n, range(n)))
+    
+    def _copy_records(self, records: List[Tuple], chunk_size: int = 5000, cursor=None):
+        """
+        Insere registros via COPY FROM STDIN (uma ida ao servidor por bloco)
+        
+        Args:
+            records: tuplas (user_id, task_id, timestamp, value, type_id, idx)
+            chunk_size: registros por bloco, limitando a memória do buffer
+            cursor: cursor a usar (padrão: self.cursor)
+        """
+        cursor = cursor or self.cursor
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator='\n')
+        
+        for start in range(0, len(records), chunk_size):
+            writer.writerows(records[start:start + chunk_size])
+            if self.driver == 'psycopg':
+                with cursor.copy(self.COPY_SQL) as copy:
+                    copy.write(buf.getvalue())
+            else:
+                buf.seek(0)
+                cursor.copy_expert(self.COPY_SQL, buf)
+            buf.seek(0)
+            buf.truncate(0)
+    
+    def _values_records(self, records: List[Tuple], page_size: int = 1000, cursor=None):
+        """
+        Insere registros com execute_values: um INSERT multi-linha por página,
+        mantendo a semântica parametrizada
+        
+        No psycopg 3 usa executemany em modo pipeline, que agrupa as idas
+        ao servidor sem reescrever o INSERT.
+        """
+        cursor = cursor or self.cursor
+        if self.driver == 'psycopg':
+            with cursor.connection.pipeline():
+                cursor.executemany(self.INSERT_SQL, records)
+            return
+        
+        execute_values(cursor, self.VALUES_SQL, records,
+                       template="(%s, %s, %s, %s, %s, %s)", page_size=page_size)
+    
+    def _executemany_records(self, records: List[Tuple], batch_size: int = 5000, cursor=None):
+        """Insere registros com executemany (baseline para comparação)"""
+        cursor = cursor or self.cursor
+        for start in range(0, len(records), batch_size):
+            cursor.executemany(self.INSERT_SQL, records[start:start + batch_size])
+    
+    def _insert_records(self, records: List[Tuple], method: str, cursor=None):
+        """
+        Insere registros pelo método escolhido
+        
+        Args:
+            records: tuplas (user_id, task_id, timestamp, value, type_id, idx)
+            method: 'copy', 'values' (execute_values) ou 'executemany'
+            cursor: cursor a usar (padrão: self.cursor)
+        """
+        if method == 'copy':
+            self._copy_records(records, cursor=cursor)
+        elif method == 'values':
+            self._values_records(records, cursor=cursor)
+        elif method == 'executemany':
+            self._executemany_records(records, cursor=cursor)
+        else:
+            raise ValueError(f"Método de inserção desconhecido: {method}")
+    
+    def _set_local(self, cursor=None, **settings):
+        """
+        Aplica parâmetros do servidor só até o fim da transação corrente
+        
+        Args:
+            cursor: cursor a usar (padrão: self.cursor)
+            settings: nome=valor, ex.: synchronous_commit='off'
+        """
+        cursor = cursor or self.cursor
+        for name, value in settings.items():
+            cursor.execute(f"SET LOCAL {name} = '{value}'")
+    
+    @contextmanager
+    def _conn(self):
+        """
+        Empresta uma conexão do pool e a devolve ao sair do bloco
+        
+        Faz commit se o bloco terminar sem erro e rollback caso contrário.
+        """
+        conn = self.pool.getconn()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.pool.putconn(conn)
+    
+    def _parallel_insert(self, records: List[Tuple], method: str = 'values', workers: int = 8):
+        """
+        Divide os registros em fatias e insere cada uma em uma conexão do pool
+        
+        Cada worker faz commit da própria fatia; as threads passam quase todo
+        o tempo dentro da libpq, então o GIL não limita o paralelismo.
+        
+        Args:
+            records: tuplas (user_id, task_id, timestamp, value, type_id, idx)
+            method: método de inserção usado por cada worker
+            workers: número de conexões/threads simultâneas (até POOL_MAX_CONN)
+        """
+        if not records:
+            return
+        
+        # Mais workers que conexões esgotaria o pool no meio da carga
+        workers = min(workers, self.POOL_MAX_CONN)
+        slice_size = -(-len(records) // workers)
+        slices = [records[i:i + slice_size] for i in range(0, len(records), slice_size)]
+        
+        def insert_slice(chunk: List[Tuple]):
+            with self._conn() as conn, conn.cursor() as cur:
+                self._set_local(cur, synchronous_commit='off')
+                self._insert_records(chunk, method, cursor=cur)
+        
+        with ThreadPoolExecutor(max_workers=len(slices)) as executor:
+            # list() propaga exceções dos workers
+            list(executor.map(insert_slice, slices))
     
     # ===== PARTE 1: TESTES DE INSERÇÃO (Issue #70) =====
     
     def insert_test_data(self, n_users: int = 10, n_tasks_per_user: int = 5):
         """Insere dados de teste (usuários e tarefas)"""
         
-        # Inserir usuários
-        for i in range(n_users):
-            self.cursor.execute(
-                "INSERT INTO test_users (username) VALUES (%s) RETURNING user_id",
-                (f"user_{i}",)
-            )
-        
-        # Inserir tarefas
-        self.cursor.execute("SELECT user_id FROM test_users")
+        # Inserir usuários (um único INSERT ... SELECT generate_series)
+        self.cursor.execute("""
+            INSERT INTO test_users (username)
+            SELECT 'user_' || g FROM generate_series(0, %s::integer - 1) AS g
+            RETURNING user_id
+        """, (n_users,))
         user_ids = [row[0] for row in self.cursor.fetchall()]
         
-        for user_id in user_ids:
-            for j in range(n_tasks_per_user):
-                self.cursor.execute(
-                    "INSERT INTO test_tasks (task_name, user_id) VALUES (%s, %s)",
-                    (f"task_{user_id}_{j}", user_id)
-                )
+        # Inserir tarefas para todos os usuários
+        self.cursor.execute("""
+            INSERT INTO test_tasks (task_name, user_id)
+            SELECT 'task_' || u.user_id || '_' || j, u.user_id
+            FROM test_users u
+            CROSS JOIN generate_series(0, %s::integer - 1) AS j
+        """, (n_tasks_per_user,))
+        
+        # IDs usados por todos os testes, buscados uma única vez
+        self._probe_user_id = user_ids[0]
+        self.cursor.execute("SELECT task_id FROM test_tasks WHERE user_id = %s LIMIT 1",
+                            (self._probe_user_id,))
+        self._probe_task_id = self.cursor.fetchone()[0]
         
         self.conn.commit()
         print(f"✓ Inseridos {n_users} usuários e {n_users * n_tasks_per_user} tarefas")
     
+    def _probe_ids(self) -> Tuple[int, int]:
+        """
+        Usuário e tarefa usados pelos testes
+        
+        Definidos por insert_test_data; numa instância nova, sobre um banco
+        já populado, são buscados uma única vez.
+        
+        Returns:
+            Tupla (user_id, task_id)
+        """
+        if self._probe_user_id is None or self._probe_task_id is None:
+            self.cursor.execute("""
+                SELECT user_id, task_id FROM test_tasks
+                WHERE user_id IS NOT NULL
+                ORDER BY user_id, task_id
+                LIMIT 1
+            """)
+            row = self.cursor.fetchone()
+            if row is None:
+                raise RuntimeError("test_users/test_tasks estão vazias; execute insert_test_data() antes dos testes")
+            self._probe_user_id, self._probe_task_id = row
+        return self._probe_user_id, self._probe_task_id
+    
     def test_single_insert(self, n_records: int = 1000) -> Dict:
         """
         Teste de inserção individual (Issue #70)
@@ -147,28 +590,35 @@ class TimeSeriesPersistenceTest:
         """
         print(f"\n--- Teste de Inserção Individual ({n_records} registros) ---")
         
-        # Buscar IDs válidos
-        self.cursor.execute("SELECT user_id FROM test_users LIMIT 1")
-        user_id = self.cursor.fetchone()[0]
+        user_id, task_id = self._probe_ids()
         
-        self.cursor.execute("SELECT task_id FROM test_tasks WHERE user_id = %s LIMIT 1", (user_id,))
-        task_id = self.cursor.fetchone()[0]
-        
-        start_time = time.time()
-        base_timestamp = datetime.now()
+        records = self._build_records(n_records, user_id, task_id, "test")
         
-        for i in range(n_records):
-            timestamp = base_timestamp + timedelta(seconds=i)
-            value = np.random.random() * 100
-            metadata = json.dumps({"index": i, "type": "test"})
+        # Statement preparado no servidor: parse/plan uma única vez
+        if self.driver == 'psycopg':
+            start_time = time.time()
             
-            self.cursor.execute("""
-                INSERT INTO test_time_series (user_id, task_id, timestamp, value, metadata)
-                VALUES (%s, %s, %s, %s, %s)
-            """, (user_id, task_id, timestamp, value, metadata))
-        
-        self.conn.commit()
-        end_time = time.time()
+            for record in records:
+                self.cursor.execute(self.INSERT_SQL, record, prepare=True)
+            
+            self.conn.commit()
+            end_time = time.time()
+        else:
+            self.cursor.execute(self.PREPARE_SQL)
+            try:
+                start_time = time.time()
+                
+                for record in records:
+                    self.cursor.execute("EXECUTE ts_ins (%s, %s, %s, %s, %s, %s)", record)
+                
+                self.conn.commit()
+                end_time = time.time()
+            except Exception:
+                self.conn.rollback()
+                raise
+            finally:
+                # O statement vive na sessão, não na transação: libera mesmo após erro
+                self.cursor.execute("DEALLOCATE ts_ins")
         
         duration = end_time - start_time
         records_per_second = n_records / duration
@@ -187,41 +637,30 @@ class TimeSeriesPersistenceTest:
         self.results['insertion']['single'] = result
         return result
     
-    def test_bulk_insert(self, n_records: int = 10000) -> Dict:
+    def test_bulk_insert(self, n_records: int = 10000, method: str = 'values') -> Dict:
         """
-        Teste de inserção em massa usando executemany (Issue #70)
+        Teste de inserção em massa usando execute_values (Issue #70)
         
         Args:
             n_records: número de registros a inserir
+            method: 'values', 'copy' ou 'executemany' (baseline para comparação)
         
         Returns:
             Dicionário com métricas de performance
         """
         print(f"\n--- Teste de Inserção em Massa ({n_records} registros) ---")
         
-        # Buscar IDs válidos
-        self.cursor.execute("SELECT user_id FROM test_users LIMIT 1")
-        user_id = self.cursor.fetchone()[0]
-        
-        self.cursor.execute("SELECT task_id FROM test_tasks WHERE user_id = %s LIMIT 1", (user_id,))
-        task_id = self.cursor.fetchone()[0]
+        user_id, task_id = self._probe_ids()
         
         # Preparar dados
-        base_timestamp = datetime.now()
-        records = []
+        records = self._build_records(n_records, user_id, task_id, "bulk_test")
         
-        for i in range(n_records):
-            timestamp = base_timestamp + timedelta(seconds=i)
-            value = np.random.random() * 100
-            metadata = json.dumps({"index": i, "type": "bulk_test"})
-            records.append((user_id, task_id, timestamp, value, metadata))
+        # Commit sem esperar o fsync do WAL: mede o custo do driver, não do disco
+        self._set_local(synchronous_commit='off')
         
         start_time = time.time()
         
-        self.cursor.executemany("""
-            INSERT INTO test_time_series (user_id, task_id, timestamp, value, metadata)
-            VALUES (%s, %s, %s, %s, %s)
-        """, records)
+        self._insert_records(records, method)
         
         self.conn.commit()
         end_time = time.time()
@@ -230,6 +669,7 @@ class TimeSeriesPersistenceTest:
         records_per_second = n_records / duration
         
         result = {
+            'method': method,
             'n_records': n_records,
             'duration_seconds': duration,
             'records_per_second': records_per_second,
@@ -243,58 +683,61 @@ class TimeSeriesPersistenceTest:
         self.results['insertion']['bulk'] = result
         return result
     
-    def test_large_series_insert(self, series_size: int = 50000) -> Dict:
+    def test_large_series_insert(self, series_size: int = 50000, method: str = 'copy',
+                                 workers: int = 8) -> Dict:
         """
         Teste com séries grandes (>10k registros) - Issue #70
         
         Args:
             series_size: tamanho da série temporal
+            method: 'copy', 'values' ou 'executemany' (baseline para comparação)
+            workers: conexões paralelas (1 = conexão única; apenas psycopg2),
+                limitadas a POOL_MAX_CONN
         
         Returns:
             Dicionário com métricas
         """
         print(f"\n--- Teste de Série Grande ({series_size} registros) ---")
         
-        self.cursor.execute("SELECT user_id FROM test_users LIMIT 1")
-        user_id = self.cursor.fetchone()[0]
-        
-        self.cursor.execute("SELECT task_id FROM test_tasks WHERE user_id = %s LIMIT 1", (user_id,))
-        task_id = self.cursor.fetchone()[0]
+        user_id, task_id = self._probe_ids()
         
         # Preparar dados
-        base_timestamp = datetime.now()
-        records = []
+        records = self._build_records(series_size, user_id, task_id, "large_series")
         
-        for i in range(series_size):
-            timestamp = base_timestamp + timedelta(seconds=i)
-            value = np.random.random() * 100
-            metadata = json.dumps({"index": i, "type": "large_series"})
-            records.append((user_id, task_id, timestamp, value, metadata))
+        # Os workers do pool aplicam o mesmo ajuste na própria transação
+        self._set_local(synchronous_commit='off')
         
         start_time = time.time()
         
-        # Inserção em batches para evitar overhead
-        batch_size = 5000
-        for i in range(0, len(records), batch_size):
-            batch = records[i:i + batch_size]
-            self.cursor.executemany("""
-                INSERT INTO test_time_series (user_id, task_id, timestamp, value, metadata)
-                VALUES (%s, %s, %s, %s, %s)
-            """, batch)
+        # COPY e execute_values já paginam internamente
+        if workers > 1 and self.pool is not None:
+            workers = min(workers, self.POOL_MAX_CONN)
+            self._parallel_insert(records, method, workers)
+        else:
+            workers = 1
+            self._insert_records(records, method)
         
         self.conn.commit()
         end_time = time.time()
         
         # Verificar consumo de disco
-        self.cursor.execute("""
-            SELECT pg_size_pretty(pg_total_relation_size('test_time_series')) as size
+        # pg_total_relation_size não inclui os chunks de uma hypertable
+        size_fn = 'hypertable_size' if self.hypertable else 'pg_total_relation_size'
+        self.cursor.execute(f"""
+            SELECT pg_size_pretty({size_fn}('test_time_series')) as size
         """)
         table_size = self.cursor.fetchone()[0]
         
+        # Série mais recente: referência para as consultas por período
+        self.cursor.execute("SELECT MAX(timestamp) FROM test_time_series")
+        self._max_ts = self.cursor.fetchone()[0]
+        
         duration = end_time - start_time
         records_per_second = series_size / duration
         
         result = {
+            'method': method,
+            'workers': workers,
             'series_size': series_size,
             'duration_seconds': duration,
             'records_per_second': records_per_second,
@@ -320,11 +763,10 @@ class TimeSeriesPersistenceTest:
         self.cursor.execute("SELECT COUNT(*) FROM test_time_series")
         count_before = self.cursor.fetchone()[0]
         
+        user_id, _ = self._probe_ids()
+        
         try:
             # Tentar inserir dados com erro intencional
-            self.cursor.execute("SELECT user_id FROM test_users LIMIT 1")
-            user_id = self.cursor.fetchone()[0]
-            
             # Inserir registro válido
             self.cursor.execute("""
                 INSERT INTO test_time_series (user_id, task_id, timestamp, value)
@@ -361,239 +803,259 @@ class TimeSeriesPersistenceTest:
     
     # ===== PARTE 2: TESTES DE CONSULTA (Issue #71) =====
     
-    def test_query_by_user(self, runs: int = 10) -> Dict:
+    def _bench(self, fn, runs: int, warmup: int = 2) -> Dict:
         """
-        Testa consulta por usuario_id e mede latências (Issue #71)
+        Executa fn repetidamente e calcula as métricas de latência
         
         Args:
-            runs: número de execuções para calcular p50/p95
+            fn: função sem argumentos com a consulta a medir
+            runs: execuções medidas
+            warmup: execuções iniciais descartadas (cache e planos frios)
         
         Returns:
-            Dicionário com métricas de latência
+            Dicionário com runs, média, mínimo, máximo e p50/p95/p99 em ms
         """
-        print(f"\n--- Teste de Consulta por Usuário ({runs} execuções) ---")
-        
-        self.cursor.execute("SELECT user_id FROM test_users LIMIT 1")
-        user_id = self.cursor.fetchone()[0]
+        for _ in range(warmup):
+            fn()
         
-        latencies = []
+        latencies = np.empty(runs, dtype=np.float64)
+        for i in range(runs):
+            t0 = time.perf_counter_ns()
+            fn()
+            latencies[i] = (time.perf_counter_ns() - t0) / 1e6
         
-        for _ in range(runs):
-            start_time = time.time()
-            
-            self.cursor.execute("""
-                SELECT * FROM test_time_series
-                WHERE user_id = %s
-                ORDER BY timestamp DESC
-                LIMIT 1000
-            """, (user_id,))
-            
-            results = self.cursor.fetchall()
-            end_time = time.time()
-            
-            latency_ms = (end_time - start_time) * 1000
-            latencies.append(latency_ms)
-        
-        result = {
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        return {
             'runs': runs,
-            'mean_ms': statistics.mean(latencies),
-            'median_ms': statistics.median(latencies),
-            'p50_ms': np.percentile(latencies, 50),
-            'p95_ms': np.percentile(latencies, 95),
-            'min_ms': min(latencies),
-            'max_ms': max(latencies)
+            'mean_ms': float(latencies.mean()),
+            'p50_ms': float(p50),
+            'p95_ms': float(p95),
+            'p99_ms': float(p99),
+            'min_ms': float(latencies.min()),
+            'max_ms': float(latencies.max())
         }
-        
+    
+    def _print_latencies(self, result: Dict):
+        """Imprime média, P50 e P95 de um resultado de _bench"""
         print(f"  Média: {result['mean_ms']:.2f}ms")
         print(f"  P50: {result['p50_ms']:.2f}ms")
         print(f"  P95: {result['p95_ms']:.2f}ms")
-        
-        self.results['query']['by_user'] = result
-        return result
     
-    def test_query_by_task(self, runs: int = 10) -> Dict:
+    def _fetch(self, sql: str, params: Tuple):
+        """Executa uma consulta no cursor principal e lê todas as linhas"""
+        self.cursor.execute(sql, params)
+        return self.cursor.fetchall()
+    
+    def _stream(self, sql: str, params: Tuple, fetch_size: int, first_row_ms: List[float]):
         """
-        Testa consulta por task_id e mede latências (Issue #71)
-        
-        Args:
-            runs: número de execuções
+        Executa uma consulta em cursor nomeado (server-side) e lê em blocos
         
-        Returns:
-            Dicionário com métricas
+        As linhas chegam em blocos de fetch_size, sem materializar o resultado
+        inteiro de uma vez; o tempo até o primeiro bloco é anexado a first_row_ms.
         """
-        print(f"\n--- Teste de Consulta por Tarefa ({runs} execuções) ---")
-        
-        self.cursor.execute("SELECT task_id FROM test_tasks LIMIT 1")
-        task_id = self.cursor.fetchone()[0]
-        
-        latencies = []
-        
-        for _ in range(runs):
-            start_time = time.time()
-            
-            self.cursor.execute("""
-                SELECT * FROM test_time_series
-                WHERE task_id = %s
-                ORDER BY timestamp DESC
-                LIMIT 1000
-            """, (task_id,))
-            
-            results = self.cursor.fetchall()
-            end_time = time.time()
+        t0 = time.perf_counter_ns()
+        # O with fecha o cursor mesmo se um fetch falhar; um cursor nomeado
+        # aberto impediria as execuções seguintes na mesma transação
+        with self.conn.cursor(name='ts_stream_cur') as cur:
+            cur.itersize = fetch_size
+            cur.execute(sql, params)
             
-            latency_ms = (end_time - start_time) * 1000
-            latencies.append(latency_ms)
-        
-        result = {
-            'runs': runs,
-            'mean_ms': statistics.mean(latencies),
-            'p50_ms': np.percentile(latencies, 50),
-            'p95_ms': np.percentile(latencies, 95)
-        }
-        
-        print(f"  Média: {result['mean_ms']:.2f}ms")
-        print(f"  P50: {result['p50_ms']:.2f}ms")
-        print(f"  P95: {result['p95_ms']:.2f}ms")
-        
-        self.results['query']['by_task'] = result
-        return result
+            rows = cur.fetchmany(fetch_size)
+            first_row_ms.append((time.perf_counter_ns() - t0) / 1e6)
+            while chunk := cur.fetchmany(fetch_size):
+                rows.extend(chunk)
+        return rows
+    
+    def _period_end(self) -> datetime:
+        """Timestamp de referência das consultas por período"""
+        if self._max_ts is None:
+            # test_large_series_insert não rodou nesta instância
+            self.cursor.execute("SELECT MAX(timestamp) FROM test_time_series")
+            self._max_ts = self.cursor.fetchone()[0]
+            if self._max_ts is None:
+                raise RuntimeError("test_time_series está vazia; insira dados antes das consultas por período")
+        return self._max_ts
     
-    def test_query_by_period(self, runs: int = 10) -> Dict:
+    def _query_params(self, name: str) -> Tuple:
+        """Parâmetros da consulta name, ver QUERY_SQL"""
+        user_id, task_id = self._probe_ids()
+        
+        if name == 'by_user':
+            return (user_id,)
+        if name == 'by_task':
+            return (task_id,)
+        
+        end_date = self._period_end()
+        if name == 'by_period':
+            return (end_date - timedelta(days=self.PERIOD_DAYS), end_date)
+        return (user_id, task_id, end_date - timedelta(hours=6), end_date)
+    
+    def _query_specs(self, names: Sequence[str] = None) -> List[Tuple[str, str, Tuple]]:
         """
-        Testa consulta por período de tempo (Issue #71)
+        Consultas de referência da Issue #71
+        
+        Só calcula os parâmetros das consultas pedidas.
         
         Args:
-            runs: número de execuções
+            names: subconjunto de QUERY_SQL (padrão: todas)
         
         Returns:
-            Dicionário com métricas
+            Lista de (nome, SQL, parâmetros)
+        """
+        if names is None:
+            names = list(self.QUERY_SQL)
+        return [(name, self.QUERY_SQL[name], self._query_params(name)) for name in names]
+    
+    def _run_query_suite(self, query_specs: List[Tuple[str, str, Tuple]], runs: int = 10,
+                         warmup: int = 2, fetch_size: int = 1000) -> Dict:
         """
-        print(f"\n--- Teste de Consulta por Período ({runs} execuções) ---")
+        Mede as consultas em sequência, com o cache ainda quente entre elas
         
-        # Buscar range de datas
-        self.cursor.execute("SELECT MIN(timestamp), MAX(timestamp) FROM test_time_series")
-        min_ts, max_ts = self.cursor.fetchone()
+        Consultas em STREAMED_QUERIES (sem LIMIT) usam cursor server-side e
+        também registram o tempo até a primeira linha.
         
-        # Definir período de 1 dia
-        end_date = max_ts
-        start_date = end_date - timedelta(days=1)
+        Args:
+            query_specs: lista de (nome, SQL, parâmetros), ver _query_specs
+            runs: execuções medidas por consulta
+            warmup: execuções iniciais descartadas (cache e planos frios)
+            fetch_size: linhas por ida ao servidor nas consultas em streaming
         
-        latencies = []
+        Returns:
+            Dicionário nome -> métricas de latência
+        """
+        # Ordenação do ORDER BY em memória, sem arquivos temporários em disco
+        self._set_local(work_mem='64MB')
         
-        for _ in range(runs):
-            start_time = time.time()
+        suite = {}
+        for name, sql, params in query_specs:
+            print(f"\n--- Teste de {self.QUERY_TITLES[name]} ({runs} execuções) ---")
             
-            self.cursor.execute("""
-                SELECT * FROM test_time_series
-                WHERE timestamp BETWEEN %s AND %s
-                ORDER BY timestamp DESC
-            """, (start_date, end_date))
+            if name in self.STREAMED_QUERIES:
+                first_row_ms = []
+                rows = []
+                
+                def run_query():
+                    rows[:] = self._stream(sql, params, fetch_size, first_row_ms)
+                
+                result = self._bench(run_query, runs, warmup)
+                first_p50, first_p95 = np.percentile(first_row_ms[warmup:], [50, 95])
+                result.update({
+                    'rows': len(rows),
+                    'first_row_p50_ms': float(first_p50),
+                    'first_row_p95_ms': float(first_p95)
+                })
+            else:
+                result = self._bench(lambda: self._fetch(sql, params), runs, warmup)
             
-            results = self.cursor.fetchall()
-            end_time = time.time()
+            if name == 'by_period':
+                result['period_days'] = self.PERIOD_DAYS
             
-            latency_ms = (end_time - start_time) * 1000
-            latencies.append(latency_ms)
-        
-        result = {
-            'runs': runs,
-            'period_days': 1,
-            'mean_ms': statistics.mean(latencies),
-            'p50_ms': np.percentile(latencies, 50),
-            'p95_ms': np.percentile(latencies, 95)
-        }
-        
-        print(f"  Média: {result['mean_ms']:.2f}ms")
-        print(f"  P50: {result['p50_ms']:.2f}ms")
-        print(f"  P95: {result['p95_ms']:.2f}ms")
+            self._print_latencies(result)
+            if 'first_row_p50_ms' in result:
+                print(f"  Primeira linha P50: {result['first_row_p50_ms']:.2f}ms")
+            
+            self.results['query'][name] = result
+            suite[name] = result
         
-        self.results['query']['by_period'] = result
-        return result
+        self.conn.commit()
+        return suite
     
-    def test_complex_query(self, runs: int = 10) -> Dict:
+    def run_query_suite(self, runs: int = 10, warmup: int = 2) -> Dict:
         """
-        Testa consulta complexa (user + task + period) - Issue #71
+        Executa todas as consultas de referência (Issue #71)
         
         Args:
-            runs: número de execuções
+            runs: número de execuções por consulta para calcular p50/p95
+            warmup: execuções iniciais descartadas
         
         Returns:
-            Dicionário com métricas
+            Dicionário nome -> métricas de latência
         """
-        print(f"\n--- Teste de Consulta Complexa ({runs} execuções) ---")
-        
-        self.cursor.execute("SELECT user_id FROM test_users LIMIT 1")
-        user_id = self.cursor.fetchone()[0]
-        
-        self.cursor.execute("SELECT task_id FROM test_tasks WHERE user_id = %s LIMIT 1", (user_id,))
-        task_id = self.cursor.fetchone()[0]
-        
-        self.cursor.execute("SELECT MAX(timestamp) FROM test_time_series")
-        max_ts = self.cursor.fetchone()[0]
-        
-        end_date = max_ts
-        start_date = end_date - timedelta(hours=6)
-        
-        latencies = []
-        
-        for _ in range(runs):
-            start_time = time.time()
-            
-            self.cursor.execute("""
-                SELECT * FROM test_time_series
-                WHERE user_id = %s 
-                  AND task_id = %s
-                  AND timestamp BETWEEN %s AND %s
-                ORDER BY timestamp DESC
-            """, (user_id, task_id, start_date, end_date))
-            
-            results = self.cursor.fetchall()
-            end_time = time.time()
-            
-            latency_ms = (end_time - start_time) * 1000
-            latencies.append(latency_ms)
-        
-        result = {
-            'runs': runs,
-            'mean_ms': statistics.mean(latencies),
-            'p50_ms': np.percentile(latencies, 50),
-            'p95_ms': np.percentile(latencies, 95)
-        }
-        
-        print(f"  Média: {result['mean_ms']:.2f}ms")
-        print(f"  P50: {result['p50_ms']:.2f}ms")
-        print(f"  P95: {result['p95_ms']:.2f}ms")
-        
-        self.results['query']['complex'] = result
-        return result
+        return self._run_query_suite(self._query_specs(), runs, warmup)
+    
+    def test_query_by_user(self, runs: int = 10, warmup: int = 2) -> Dict:
+        """Testa consulta por usuario_id e mede latências (Issue #71)"""
+        return self._run_query_suite(self._query_specs(['by_user']), runs, warmup)['by_user']
+    
+    def test_query_by_task(self, runs: int = 10, warmup: int = 2) -> Dict:
+        """Testa consulta por task_id e mede latências (Issue #71)"""
+        return self._run_query_suite(self._query_specs(['by_task']), runs, warmup)['by_task']
+    
+    def test_query_by_period(self, runs: int = 10, warmup: int = 2,
+                             fetch_size: int = 1000) -> Dict:
+        """Testa consulta por período de tempo (Issue #71)"""
+        specs = self._query_specs(['by_period'])
+        return self._run_query_suite(specs, runs, warmup, fetch_size)['by_period']
     
-    def analyze_query_plans(self):
+    def test_complex_query(self, runs: int = 10, warmup: int = 2) -> Dict:
+        """Testa consulta complexa (user + task + period) - Issue #71"""
+        return self._run_query_suite(self._query_specs(['complex']), runs, warmup)['complex']
+    
+    @staticmethod
+    def _leaf_node_types(plan: Dict) -> List[str]:
+        """Tipos dos nós folha (as leituras de tabela/índice) de um plano JSON"""
+        children = plan.get('Plans')
+        if not children:
+            return [plan['Node Type']]
+        types = []
+        for child in children:
+            types.extend(TimeSeriesPersistenceTest._leaf_node_types(child))
+        return types
+    
+    def analyze_query_plans(self) -> Dict:
         """
         Analisa planos de execução das consultas (Issue #71)
+        
+        Usa EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) e guarda, por consulta, o
+        tipo de leitura escolhido e os blocos lidos do cache/disco em
+        results['indexes']['plans'].
+        
+        Returns:
+            Dicionário com o resumo de cada plano
         """
         print("\n--- Análise de Planos de Execução ---")
         
-        self.cursor.execute("SELECT user_id FROM test_users LIMIT 1")
-        user_id = self.cursor.fetchone()[0]
+        user_id, _ = self._probe_ids()
         
         queries = [
-            ("Query por user_id", f"SELECT * FROM test_time_series WHERE user_id = {user_id} LIMIT 100"),
-            ("Query por período", f"SELECT * FROM test_time_series WHERE timestamp > NOW() - INTERVAL '1 day' LIMIT 100"),
-            ("Query complexa", f"SELECT * FROM test_time_series WHERE user_id = {user_id} AND timestamp > NOW() - INTERVAL '1 hour'")
+            ("by_user", "Query por user_id", f"SELECT timestamp, value FROM test_time_series WHERE user_id = {user_id} LIMIT 100"),
+            ("by_period", "Query por período", f"SELECT timestamp, value FROM test_time_series WHERE timestamp > NOW() - INTERVAL '1 day' LIMIT 100"),
+            ("complex", "Query complexa", f"SELECT timestamp, value FROM test_time_series WHERE user_id = {user_id} AND timestamp > NOW() - INTERVAL '1 hour'")
         ]
         
-        for name, query in queries:
+        plans = {}
+        for key, name, query in queries:
+            self.cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query}")
+            plan = self.cursor.fetchone()[0][0]
+            root = plan['Plan']
+            scans = self._leaf_node_types(root)
+            
+            plans[key] = {
+                'name': name,
+                'node_type': root['Node Type'],
+                'scan_types': scans,
+                'uses_index': all(t in self.INDEX_NODE_TYPES for t in scans),
+                'shared_hit_blocks': root.get('Shared Hit Blocks', 0),
+                'shared_read_blocks': root.get('Shared Read Blocks', 0),
+                'actual_total_time_ms': root['Actual Total Time'],
+                'execution_time_ms': plan.get('Execution Time')
+            }
+            
+            data = plans[key]
             print(f"\n{name}:")
-            self.cursor.execute(f"EXPLAIN ANALYZE {query}")
-            plan = self.cursor.fetchall()
-            for line in plan:
-                print(f"  {line[0]}")
+            print(f"  Nó raiz: {data['node_type']} | Leituras: {', '.join(sorted(set(scans)))}")
+            print(f"  Blocos (cache/disco): {data['shared_hit_blocks']}/{data['shared_read_blocks']}")
+            print(f"  Tempo: {data['actual_total_time_ms']:.2f}ms")
+        
+        self.conn.commit()
+        self.results['indexes']['plans'] = plans
+        return plans
     
     def cleanup_test_data(self):
         """Remove dados e tabelas de teste"""
         print("\n--- Limpeza de Dados de Teste ---")
         
-        tables = ['test_time_series', 'test_tasks', 'test_users']
+        tables = ['test_time_series', 'test_md_type', 'test_tasks', 'test_users']
         
         for table in tables:
             self.cursor.execute(f"DROP TABLE IF EXISTS {table} CASCADE")
@@ -629,6 +1091,18 @@ class TimeSeriesPersistenceTest:
             print(f"   - Duração: {data['duration_seconds']:.2f}s")
             print(f"   - Tamanho da tabela: {data['table_size']}")
         
+        if 'compression' in self.results['insertion']:
+            data = self.results['insertion']['compression']
+            print(f"\n   Compressão TimescaleDB:")
+            print(f"   - Duração: {data['duration_seconds']:.2f}s")
+            print(f"   - Tamanho da tabela comprimida: {data['table_size']}")
+        
+        if 'build_duration_seconds' in self.results['indexes']:
+            print(f"\n4. Criação de Índices (após a carga):")
+            print(f"   - Duração: {self.results['indexes']['build_duration_seconds']:.2f}s")
+            for name, size in self.results['indexes'].get('sizes', {}).items():
+                print(f"   - {name}: {size / 1024:.1f} KB")
+        
         print("\n### ISSUE #71 - TESTES DE CONSULTA ###")
         
         if 'by_user' in self.results['query']:
@@ -648,6 +1122,8 @@ class TimeSeriesPersistenceTest:
             print(f"\n3. Consulta por Período:")
             print(f"   - P50: {data['p50_ms']:.2f}ms")
             print(f"   - P95: {data['p95_ms']:.2f}ms")
+            if 'first_row_p50_ms' in data:
+                print(f"   - Primeira linha P50: {data['first_row_p50_ms']:.2f}ms")
         
         if 'complex' in self.results['query']:
             data = self.results['query']['complex']
@@ -655,6 +1131,12 @@ class TimeSeriesPersistenceTest:
             print(f"   - P50: {data['p50_ms']:.2f}ms")
             print(f"   - P95: {data['p95_ms']:.2f}ms")
         
+        if 'plans' in self.results['indexes']:
+            print("\n### PLANOS DE EXECUÇÃO ###")
+            for data in self.results['indexes']['plans'].values():
+                status = "✓" if data['uses_index'] else "✗ sem índice"
+                print(f"   {status} {data['name']}: {', '.join(sorted(set(data['scan_types'])))}")
+        
         print("\n" + "="*60)
 
 
@@ -679,8 +1161,11 @@ def main():
         
         # Preparar ambiente
         test.create_test_tables()
+        test.create_hypertable()
         test.insert_test_data(n_users=10, n_tasks_per_user=5)
-        test.create_indexes()
+        
+        # Carga sobre a tabela sem índices; eles são criados após as inserções
+        test.drop_indexes()
         
         # ===== TESTES DE INSERÇÃO (Issue #70) =====
         print("\n" + "="*60)
@@ -690,6 +1175,8 @@ def main():
         test.test_single_insert(n_records=1000)
         test.test_bulk_insert(n_records=10000)
         test.test_large_series_insert(series_size=50000)
+        test.create_indexes()
+        test.compress_chunks()
         test.test_transaction_rollback()
         
         # ===== TESTES DE CONSULTA (Issue #71) =====
@@ -697,10 +1184,7 @@ def main():
         print("EXECUTANDO TESTES DA ISSUE #71 - CONSULTAS")
         print("="*60)
         
-        test.test_query_by_user(runs=10)
-        test.test_query_by_task(runs=10)
-        test.test_query_by_period(runs=10)
-        test.test_complex_query(runs=10)
+        test.run_query_suite(runs=10)
         
         # Análise de planos de execução
         test.analyze_query_plans()